@@ -13,21 +13,75 @@ The client automatically uses the AWS SDK credential provider chain:
 - Instance metadata service (IMDS)
 """
 
+import asyncio
+import contextlib
+import importlib.util
+import json
 import logging
 import os
-from typing import Any, Dict, Iterator, Optional
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import cache
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, NoReturn, Optional, Union
+
+from biomni.config import BiomniConfig, default_config
 
 try:
-    import boto3
-    from botocore.config import Config
-    from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
-    
-    BOTO3_AVAILABLE = True
+    import orjson
+
+    _orjson_available = True
 except ImportError:
-    BOTO3_AVAILABLE = False
+    orjson = None
+    _orjson_available = False
+
+# boto3/botocore are imported lazily by _ensure_boto3() so that importing this
+# module does not pay the boto3 import cost for runs that never touch Bedrock.
+BOTO3_AVAILABLE = importlib.util.find_spec("boto3") is not None
+
+boto3 = None
+botocore = None
+Config = None
+BotoCoreError = None
+ClientError = None
+NoCredentialsError = None
+
+# Optional, only needed for the async streaming API (see _ensure_aioboto3)
+aioboto3 = None
+AioSession = None
 
 logger = logging.getLogger(__name__)
 
+# Same cache directory the AWS CLI uses for assume-role credentials
+_AWS_CLI_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".aws", "cli", "cache")
+
+# Serializes first-time creation of the shared sessions (see _get_session)
+_sessions_lock = threading.Lock()
+
+# Per-session state for the shared sessions (see _session_state). Keyed
+# weakly, so an entry goes away with its session once _get_session drops it
+# and no manager still uses it.
+_session_states: "weakref.WeakKeyDictionary[Any, _SessionState]" = weakref.WeakKeyDictionary()
+_session_states_lock = threading.Lock()
+
+# Most low-level clients kept per session when BIOMNI_CACHE_BOTO_CLIENTS=1
+_MAX_CACHED_CLIENTS = 32
+
+# Set by AWS runtimes that issue IAM role credentials
+_AWS_RUNTIME_ENV_VARS = (
+    # Lambda
+    "AWS_LAMBDA_FUNCTION_NAME",
+    "AWS_EXECUTION_ENV",
+    # ECS tasks
+    "AWS_CONTAINER_CREDENTIALS_RELATIVE_URI",
+    "ECS_CONTAINER_METADATA_URI_V4",
+    # EKS Pod Identity
+    "AWS_CONTAINER_CREDENTIALS_FULL_URI",
+    # EKS IAM roles for service accounts (set together with AWS_ROLE_ARN)
+    "AWS_WEB_IDENTITY_TOKEN_FILE",
+)
+
 
 class BedrockClientError(Exception):
     """Base exception for Bedrock client errors."""
@@ -39,6 +93,276 @@ class BedrockAuthenticationError(BedrockClientError):
     pass
 
 
+# Help text attached to authentication and setup errors
+_BOTO3_REQUIRED_MESSAGE = "boto3 is required for AWS Bedrock support. Install with: pip install boto3"
+_AIOBOTO3_REQUIRED_MESSAGE = (
+    "aioboto3 is required for async Bedrock streaming. Install with: pip install aioboto3"
+)
+_SESSION_HELP = (
+    "Ensure you have valid AWS credentials configured via:\n"
+    "  - IAM role (for EC2/ECS/EKS/Lambda/SageMaker/etc.)\n"
+    "  - AWS_PROFILE environment variable\n"
+    "  - AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY environment variables\n"
+    "  - ~/.aws/credentials file"
+)
+_NO_CREDENTIALS_MESSAGE = (
+    "No AWS credentials found. Please configure credentials via:\n"
+    "  - IAM role (recommended for production)\n"
+    "  - AWS_PROFILE environment variable (for local development)\n"
+    "  - AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY environment variables\n"
+    "  - ~/.aws/credentials file"
+)
+
+
+def _ensure_boto3() -> None:
+    """
+    Import boto3/botocore on first use and bind them as module globals.
+    
+    Raises:
+        BedrockClientError: If boto3 is not installed
+    """
+    global boto3, botocore, Config, BotoCoreError, ClientError, NoCredentialsError
+    
+    if boto3 is not None:
+        return
+    
+    try:
+        import boto3 as _boto3
+        import botocore.credentials
+        import botocore.session
+        from botocore.config import Config as _Config
+        from botocore.exceptions import BotoCoreError as _BotoCoreError
+        from botocore.exceptions import ClientError as _ClientError
+        from botocore.exceptions import NoCredentialsError as _NoCredentialsError
+    except ImportError as e:
+        raise BedrockClientError(_BOTO3_REQUIRED_MESSAGE) from e
+    
+    Config = _Config
+    BotoCoreError = _BotoCoreError
+    ClientError = _ClientError
+    NoCredentialsError = _NoCredentialsError
+    boto3 = _boto3
+
+
+def _ensure_aioboto3() -> None:
+    """
+    Import aioboto3 on first use and bind it as a module global.
+    
+    Raises:
+        BedrockClientError: If aioboto3 is not installed
+    """
+    global aioboto3, AioSession
+    
+    if aioboto3 is not None:
+        return
+    
+    try:
+        import aioboto3 as _aioboto3
+        from aiobotocore.session import AioSession as _AioSession
+    except ImportError as e:
+        raise BedrockClientError(_AIOBOTO3_REQUIRED_MESSAGE) from e
+    
+    AioSession = _AioSession
+    aioboto3 = _aioboto3
+
+
+# Help text for Bedrock ClientError codes, formatted with model_id, region,
+# operation and message
+_CLIENT_ERROR_MESSAGES: Dict[str, str] = {
+    "AccessDeniedException": (
+        "Access denied to model {model_id}. "
+        "Ensure your IAM role/user has bedrock:{operation} permission "
+        "and the model is enabled in region {region}.\n"
+        "Error: {message}"
+    ),
+    "ResourceNotFoundException": (
+        "Model {model_id} not found in region {region}. "
+        "Verify the model ID and ensure it's available in your region.\n"
+        "Error: {message}"
+    ),
+    "ThrottlingException": (
+        "Request throttled for model {model_id} after all retries were used. "
+        "Consider lowering request concurrency, raising BIOMNI_BEDROCK_MAX_RETRIES "
+        "or requesting a quota increase.\n"
+        "Error: {message}"
+    ),
+}
+
+_DEFAULT_CLIENT_ERROR_MESSAGE = "Failed to invoke model {model_id} via {operation}: [{code}] {message}"
+
+
+def _encode_body(body: Union[bytes, Dict[str, Any], list]) -> bytes:
+    """
+    Serialize a dict/list request body to JSON bytes; bytes pass through.
+    
+    Non-string dict keys are accepted with and without orjson, as json.dumps
+    converts them to strings.
+    
+    Raises:
+        BedrockClientError: If the body cannot be serialized to JSON
+    """
+    if not isinstance(body, (dict, list)):
+        return body
+    try:
+        if _orjson_available:
+            return orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(body).encode()
+    except (TypeError, ValueError) as e:
+        raise BedrockClientError(f"Request body is not JSON serializable: {e}") from e
+
+
+def _decode_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if _orjson_available:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _raise_client_error(error: Exception, model_id: str, region: str, operation: str) -> NoReturn:
+    """
+    Translate a botocore ClientError into a BedrockClientError.
+    
+    Args:
+        error: The ClientError raised by the runtime client
+        model_id: The model ID that was invoked
+        region: The AWS region of the client
+        operation: The Bedrock API operation (e.g., "InvokeModel")
+        
+    Raises:
+        BedrockClientError: Always
+    """
+    err = error.response.get("Error", {})
+    code = err.get("Code", "Unknown")
+    template = _CLIENT_ERROR_MESSAGES.get(code, _DEFAULT_CLIENT_ERROR_MESSAGE)
+    raise BedrockClientError(
+        template.format(
+            model_id=model_id,
+            region=region,
+            operation=operation,
+            code=code,
+            message=err.get("Message", str(error)),
+        )
+    ) from error
+
+
+def _create_session(profile_name: Optional[str]):
+    """
+    Create a boto3 session for the given profile.
+    
+    The session is built on a botocore session whose assume-role provider
+    shares the AWS CLI credential cache, so role/MFA profiles do not call
+    sts:AssumeRole again on every process start.
+    """
+    if profile_name:
+        logger.info("Creating AWS session with profile: %s", profile_name)
+    else:
+        logger.info("Creating AWS session with default credential chain")
+    botocore_session = botocore.session.Session(profile=profile_name)
+    _use_cli_credential_cache(botocore_session)
+    return boto3.Session(botocore_session=botocore_session)
+
+
+def _create_async_session(profile_name: Optional[str]):
+    """Create an aioboto3 session for the given profile, like _create_session."""
+    botocore_session = AioSession(profile=profile_name)
+    _use_cli_credential_cache(botocore_session)
+    return aioboto3.Session(botocore_session=botocore_session)
+
+
+def _use_cli_credential_cache(botocore_session) -> None:
+    """Cache assume-role credentials of a botocore session in the AWS CLI cache."""
+    botocore_session.get_component("credential_provider").get_provider(
+        "assume-role"
+    ).cache = botocore.credentials.JSONFileCache(_AWS_CLI_CACHE_DIR)
+
+
+def _run_in_background(fn: Callable[[], Any], name: str) -> Future:
+    """
+    Run ``fn`` in a daemon thread and return a Future for its result.
+    
+    Daemon threads are used (rather than a ThreadPoolExecutor, whose workers
+    are joined at exit) so a pending network call never delays shutdown.
+    """
+    future: Future = Future()
+    
+    def runner() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn())
+        except Exception as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=runner, name=name, daemon=True).start()
+    return future
+
+
+class _SessionState:
+    """Lock and low-level client cache for one shared boto3 session."""
+    
+    __slots__ = ("lock", "clients")
+    
+    def __init__(self):
+        # boto3 sessions are not thread-safe, and one session is shared by
+        # every manager for a profile, including their background warm-up and
+        # validation threads. Client creation and credential resolution on
+        # the session hold this lock.
+        self.lock = threading.Lock()
+        # (service name, manager settings) -> client, least recently used first
+        self.clients: "OrderedDict[tuple, Any]" = OrderedDict()
+
+
+def _session_state(session) -> _SessionState:
+    """Return the state for a session, creating it on first use."""
+    with _session_states_lock:
+        state = _session_states.get(session)
+        if state is None:
+            state = _session_states[session] = _SessionState()
+    return state
+
+
+def _create_client(session, service_name: str, config, cache_key: tuple):
+    """
+    Create a boto3 client, reusing a cached one if client caching is enabled.
+    
+    Building a client loads the service model, which is the expensive part
+    when managers are re-created (tests, multi-region setups). Caching is
+    opt-in via BIOMNI_CACHE_BOTO_CLIENTS=1 because it also makes patches on
+    a fresh client invisible to later managers. At most _MAX_CACHED_CLIENTS
+    clients are kept per session, evicting the least recently used.
+    """
+    state = _session_state(session)
+    if os.getenv("BIOMNI_CACHE_BOTO_CLIENTS") != "1":
+        with state.lock:
+            return session.client(service_name, config=config)
+    
+    key = (service_name, cache_key)
+    with state.lock:
+        client = state.clients.get(key)
+        if client is not None:
+            state.clients.move_to_end(key)
+            return client
+        client = session.client(service_name, config=config)
+        state.clients[key] = client
+        if len(state.clients) > _MAX_CACHED_CLIENTS:
+            state.clients.popitem(last=False)
+    return client
+
+
+@cache
+def _get_session(profile_name: Optional[str]):
+    """
+    Return the process-wide boto3 session for a profile, creating it once.
+    
+    Sessions are keyed by profile only (not region, which is set per client
+    through Config), so managers for different regions reuse one credential
+    provider chain and refresh state. Call ``_get_session.cache_clear()`` to
+    drop them, e.g. in tests that patch boto3.Session or AWS env vars; their
+    cached clients are released along with them.
+    """
+    return _create_session(profile_name)
+
+
 class BedrockClientManager:
     """
     Manages AWS Bedrock client instances with IAM role authentication.
@@ -47,10 +371,10 @@ class BedrockClientManager:
     clients using boto3, with proper error handling and credential validation.
     
     Example:
-        manager = BedrockClientManager(region="us-east-1")
+        manager = BedrockClientManager(region_name="us-east-1")
         response = manager.invoke_model(
             model_id="anthropic.claude-3-sonnet-20240229-v1:0",
-            payload={
+            body={
                 "anthropic_version": "bedrock-2023-05-31",
                 "max_tokens": 1024,
                 "messages": [{"role": "user", "content": "Hello"}]
@@ -62,9 +386,15 @@ class BedrockClientManager:
         self,
         region_name: Optional[str] = None,
         profile_name: Optional[str] = None,
-        max_retries: int = 5,
-        connect_timeout: int = 60,
+        max_retries: Optional[int] = None,
+        connect_timeout: Optional[int] = None,
         read_timeout: int = 300,
+        validate: bool = False,
+        retry_mode: Optional[str] = None,
+        fail_fast: bool = False,
+        max_pool_connections: int = 50,
+        warm: bool = False,
+        defaults_mode: Optional[str] = None,
     ):
         """
         Initialize Bedrock client manager.
@@ -72,19 +402,33 @@ class BedrockClientManager:
         Args:
             region_name: AWS region (defaults to AWS_REGION env var or us-east-1)
             profile_name: AWS profile name (defaults to AWS_PROFILE env var)
-            max_retries: Maximum number of retry attempts (default: 5)
-            connect_timeout: Connection timeout in seconds (default: 60)
+            max_retries: Maximum number of retry attempts; defaults to the
+                AWS_MAX_ATTEMPTS env var (total attempts, applied by botocore)
+                or 5
+            connect_timeout: Connection timeout in seconds (default: set by
+                the botocore defaults mode, e.g. 3.1s for "standard")
             read_timeout: Read timeout in seconds (default: 300)
+            validate: Verify credentials with STS GetCallerIdentity on first
+                client access (default: False)
+            retry_mode: botocore retry mode, "standard" or "adaptive";
+                defaults to the AWS_RETRY_MODE env var or "standard"
+            fail_fast: Use a 3 second connect timeout and at most 2 retries,
+                overriding connect_timeout and max_retries (default: False)
+            max_pool_connections: Maximum number of pooled HTTP connections
+                per client; sized for concurrent invocations rather than
+                botocore's default of 10 (default: 50)
+            warm: Open a connection to bedrock-runtime in a background thread
+                so the first invocation skips the TCP/TLS handshake
+                (default: False)
+            defaults_mode: botocore defaults mode ("standard", "in-region",
+                "cross-region", "mobile" or "auto"); defaults to the
+                AWS_DEFAULTS_MODE env var or "standard"
             
         Raises:
             BedrockClientError: If boto3 is not installed
-            BedrockAuthenticationError: If credentials cannot be resolved
+            BedrockAuthenticationError: If the AWS session cannot be created
         """
-        if not BOTO3_AVAILABLE:
-            raise BedrockClientError(
-                "boto3 is required for AWS Bedrock support. "
-                "Install with: pip install boto3"
-            )
+        _ensure_boto3()
         
         # Resolve region
         self.region_name = (
@@ -97,68 +441,189 @@ class BedrockClientManager:
         # Resolve profile (only if explicitly set)
         self.profile_name = profile_name or os.getenv("AWS_PROFILE")
         
-        # Create boto3 session
+        # Reuse the process-wide boto3 session for this profile, creating it on
+        # first use
         try:
-            if self.profile_name:
-                logger.info(f"Creating AWS session with profile: {self.profile_name}")
-                self.session = boto3.Session(profile_name=self.profile_name)
-            else:
-                logger.info("Creating AWS session with default credential chain")
-                self.session = boto3.Session()
+            with _sessions_lock:
+                self.session = _get_session(self.profile_name)
         except Exception as e:
             raise BedrockAuthenticationError(
-                f"Failed to create AWS session: {e}\n"
-                "Ensure you have valid AWS credentials configured via:\n"
-                "  - IAM role (for EC2/ECS/EKS/Lambda/SageMaker/etc.)\n"
-                "  - AWS_PROFILE environment variable\n"
-                "  - AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY environment variables\n"
-                "  - ~/.aws/credentials file"
+                f"Failed to create AWS session: {e}\n{_SESSION_HELP}"
             ) from e
         
-        # Configure boto3 client settings
+        if fail_fast:
+            connect_timeout = 3
+            max_retries = 2
+        
+        # Explicit arguments win. Otherwise a retry setting from the AWS env
+        # vars is left out of the Config so botocore applies it, and only
+        # when neither is set are Biomni's defaults used.
+        retries = {}
+        if max_retries is None and not os.getenv("AWS_MAX_ATTEMPTS"):
+            max_retries = 5
+        if max_retries is not None:
+            retries["max_attempts"] = max_retries
+        if retry_mode is None and not os.getenv("AWS_RETRY_MODE"):
+            retry_mode = "standard"
+        if retry_mode is not None:
+            retries["mode"] = retry_mode
+        # None when botocore takes the value from AWS_MAX_ATTEMPTS
+        self.max_retries = max_retries
+        
+        defaults_mode = defaults_mode or os.getenv("AWS_DEFAULTS_MODE") or "standard"
+        
+        # None values are resolved by botocore (defaults mode or AWS env vars)
+        logger.info(
+            "Bedrock client config: region=%s, defaults_mode=%s, connect_timeout_s=%s, "
+            "read_timeout_s=%s, retries=%s, retry_mode=%s, max_pool_connections=%s",
+            self.region_name,
+            defaults_mode,
+            connect_timeout,
+            read_timeout,
+            max_retries,
+            retry_mode,
+            max_pool_connections,
+        )
+        
+        # Configure boto3 client settings. The same Config instance is shared by
+        # runtime_client and bedrock_client, so TCP keep-alive applies to both
+        # and idle pooled connections are reused instead of re-handshaking TLS.
+        # botocore always sets TCP_NODELAY on client sockets, so small requests
+        # and streaming frames are not delayed by Nagle's algorithm.
+        # Retries, including ThrottlingException, are left to botocore; its
+        # standard mode backs off each request independently with capped
+        # exponential delays and jitter, unlike adaptive mode's client-wide
+        # rate limiter.
+        # The connect timeout is only passed when overridden, so the defaults
+        # mode can pick one suited to the environment. The read timeout is
+        # always explicit since model responses can take minutes.
+        self._config_key = (
+            self.region_name,
+            max_retries,
+            retry_mode,
+            connect_timeout,
+            read_timeout,
+            max_pool_connections,
+            defaults_mode,
+        )
+        timeouts = {"read_timeout": read_timeout}
+        if connect_timeout is not None:
+            timeouts["connect_timeout"] = connect_timeout
         self.config = Config(
-            retries={"max_attempts": max_retries, "mode": "adaptive"},
-            connect_timeout=connect_timeout,
-            read_timeout=read_timeout,
+            retries=retries,
             region_name=self.region_name,
+            tcp_keepalive=True,
+            max_pool_connections=max_pool_connections,
+            defaults_mode=defaults_mode,
+            **timeouts,
         )
         
         # Create clients
         self._runtime_client = None
         self._bedrock_client = None
+        self._sts_client = None
+        self._async_session = None
+        self._async_runtime_client = None
+        self._async_exit_stack = None
+        self._async_lock = None
+        self._async_loop = None
+        self._client_lock = threading.Lock()
+        
+        # Credentials are validated on first client access, not here. When the
+        # STS check is requested it is started in the background right away so
+        # its round trip overlaps with the caller's own initialization.
+        self.validate = validate
+        self._validated = False
+        self._validate_future = None
+        if validate:
+            self._validate_future = _run_in_background(self._validate_credentials, "bedrock-validate")
+        
+        self._warm_future = None
+        if warm:
+            self._warm_future = _run_in_background(self._warm_connection_pool, "bedrock-warm")
+    
+    @classmethod
+    def from_config(cls, config: BiomniConfig, **kwargs: Any) -> "BedrockClientManager":
+        """
+        Create a manager from the AWS settings of a BiomniConfig.
         
-        # Validate credentials on initialization
-        self._validate_credentials()
+        Uses ``aws_region``, ``aws_profile`` and ``bedrock_max_retries`` so the
+        environment does not have to be read again; any keyword argument of
+        ``__init__`` can be passed to override them.
+        
+        Args:
+            config: Configuration to take the AWS settings from
+            **kwargs: Additional or overriding BedrockClientManager arguments
+            
+        Returns:
+            BedrockClientManager instance
+        """
+        kwargs.setdefault("region_name", config.aws_region)
+        kwargs.setdefault("profile_name", config.aws_profile)
+        kwargs.setdefault("max_retries", config.bedrock_max_retries)
+        return cls(**kwargs)
+    
+    def _warm_connection_pool(self) -> None:
+        """Open a pooled HTTPS connection to bedrock-runtime ahead of first use."""
+        try:
+            self.runtime_client.list_async_invokes(maxResults=1)
+        except Exception as e:
+            # Even an error response (e.g. AccessDenied) leaves a warm connection
+            logger.debug("Bedrock connection warm-up call failed: %s", e)
+    
+    def _ensure_validated(self) -> None:
+        """Validate credentials once, before the first client is created."""
+        if not self._validated:
+            if self._validate_future is not None:
+                # Waits for the background check and re-raises its error. A
+                # failed check is dropped so the next access validates again,
+                # e.g. after an SSO login.
+                try:
+                    self._validate_future.result()
+                finally:
+                    self._validate_future = None
+            else:
+                self._validate_credentials()
+            self._validated = True
     
     def _validate_credentials(self) -> None:
         """
         Validate that AWS credentials can be resolved.
         
+        The STS GetCallerIdentity check is only performed when the manager
+        was created with ``validate=True``, and is skipped under AWS runtimes
+        that provide IAM role credentials themselves.
+        
         Raises:
             BedrockAuthenticationError: If credentials cannot be resolved
         """
         try:
             # Try to get credentials to verify they exist
-            credentials = self.session.get_credentials()
+            with _session_state(self.session).lock:
+                credentials = self.session.get_credentials()
             if credentials is None:
-                raise BedrockAuthenticationError(
-                    "No AWS credentials found. Please configure credentials via:\n"
-                    "  - IAM role (recommended for production)\n"
-                    "  - AWS_PROFILE environment variable (for local development)\n"
-                    "  - AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY environment variables\n"
-                    "  - ~/.aws/credentials file"
-                )
+                raise BedrockAuthenticationError(_NO_CREDENTIALS_MESSAGE)
+            
+            if not self.validate:
+                return
+            
+            # Role credentials issued by the AWS runtime need no STS round trip
+            if any(os.getenv(name) for name in _AWS_RUNTIME_ENV_VARS):
+                logger.info("Running with AWS runtime IAM role credentials; skipping STS validation")
+                return
             
             # Optional: verify with STS GetCallerIdentity
             try:
-                sts = self.session.client("sts", config=self.config)
-                identity = sts.get_caller_identity()
+                if self._sts_client is None:
+                    self._sts_client = _create_client(self.session, "sts", self.config, self._config_key)
+                identity = self._sts_client.get_caller_identity()
                 logger.info(
-                    f"AWS credentials validated. Account: {identity['Account']}, "
-                    f"ARN: {identity['Arn']}"
+                    "AWS credentials validated. Account: %s, ARN: %s",
+                    identity["Account"],
+                    identity["Arn"],
                 )
             except Exception as e:
-                logger.warning(f"Could not verify credentials with STS: {e}")
+                logger.warning("Could not verify credentials with STS: %s", e)
                 # Don't fail here - credentials might still work for Bedrock
                 
         except NoCredentialsError as e:
@@ -170,49 +635,56 @@ class BedrockClientManager:
     def runtime_client(self):
         """Get or create the bedrock-runtime client."""
         if self._runtime_client is None:
-            try:
-                self._runtime_client = self.session.client(
-                    "bedrock-runtime",
-                    config=self.config,
-                )
-                logger.info(f"Created bedrock-runtime client in region: {self.region_name}")
-            except Exception as e:
-                raise BedrockClientError(
-                    f"Failed to create bedrock-runtime client: {e}\n"
-                    f"Region: {self.region_name}\n"
-                    "Ensure the AWS Bedrock service is available in your region."
-                ) from e
+            with self._client_lock:
+                if self._runtime_client is None:
+                    self._ensure_validated()
+                    try:
+                        self._runtime_client = _create_client(
+                            self.session, "bedrock-runtime", self.config, self._config_key
+                        )
+                        logger.info("Created bedrock-runtime client in region: %s", self.region_name)
+                    except Exception as e:
+                        raise BedrockClientError(
+                            f"Failed to create bedrock-runtime client: {e}\n"
+                            f"Region: {self.region_name}\n"
+                            "Ensure the AWS Bedrock service is available in your region."
+                        ) from e
         return self._runtime_client
     
     @property
     def bedrock_client(self):
         """Get or create the bedrock client (for control plane operations)."""
         if self._bedrock_client is None:
-            try:
-                self._bedrock_client = self.session.client(
-                    "bedrock",
-                    config=self.config,
-                )
-                logger.info(f"Created bedrock client in region: {self.region_name}")
-            except Exception as e:
-                raise BedrockClientError(
-                    f"Failed to create bedrock client: {e}"
-                ) from e
+            with self._client_lock:
+                if self._bedrock_client is None:
+                    self._ensure_validated()
+                    try:
+                        self._bedrock_client = _create_client(
+                            self.session, "bedrock", self.config, self._config_key
+                        )
+                        logger.info("Created bedrock client in region: %s", self.region_name)
+                    except Exception as e:
+                        raise BedrockClientError(
+                            f"Failed to create bedrock client: {e}"
+                        ) from e
         return self._bedrock_client
     
     def invoke_model(
         self,
         model_id: str,
-        body: bytes,
+        body: Union[bytes, Dict[str, Any], list],
         accept: str = "application/json",
         content_type: str = "application/json",
     ) -> Dict[str, Any]:
         """
         Invoke a Bedrock model (non-streaming).
         
+        Throttled and transient failures are retried by botocore up to
+        ``max_retries`` times with capped exponential backoff and jitter.
+        
         Args:
             model_id: The model ID (e.g., "anthropic.claude-3-sonnet-20240229-v1:0")
-            body: The request body as bytes
+            body: The request body as bytes, or a dict/list to serialize as JSON
             accept: The accept header (default: "application/json")
             content_type: The content type header (default: "application/json")
             
@@ -223,6 +695,7 @@ class BedrockClientManager:
             BedrockClientError: If the invocation fails
         """
         try:
+            body = _encode_body(body)
             response = self.runtime_client.invoke_model(
                 modelId=model_id,
                 body=body,
@@ -231,33 +704,9 @@ class BedrockClientManager:
             )
             return response
         except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            error_message = e.response.get("Error", {}).get("Message", str(e))
-            
-            # Provide helpful error messages
-            if error_code == "AccessDeniedException":
-                raise BedrockClientError(
-                    f"Access denied to model {model_id}. "
-                    f"Ensure your IAM role/user has bedrock:InvokeModel permission "
-                    f"and the model is enabled in region {self.region_name}.\n"
-                    f"Error: {error_message}"
-                ) from e
-            elif error_code == "ResourceNotFoundException":
-                raise BedrockClientError(
-                    f"Model {model_id} not found in region {self.region_name}. "
-                    f"Verify the model ID and ensure it's available in your region.\n"
-                    f"Error: {error_message}"
-                ) from e
-            elif error_code == "ThrottlingException":
-                raise BedrockClientError(
-                    f"Request throttled for model {model_id}. "
-                    f"Consider implementing exponential backoff or requesting a quota increase.\n"
-                    f"Error: {error_message}"
-                ) from e
-            else:
-                raise BedrockClientError(
-                    f"Failed to invoke model {model_id}: [{error_code}] {error_message}"
-                ) from e
+            _raise_client_error(e, model_id, self.region_name, "InvokeModel")
+        except BedrockClientError:
+            raise
         except (BotoCoreError, Exception) as e:
             raise BedrockClientError(
                 f"Unexpected error invoking model {model_id}: {e}"
@@ -266,26 +715,31 @@ class BedrockClientManager:
     def invoke_model_with_response_stream(
         self,
         model_id: str,
-        body: bytes,
+        body: Union[bytes, Dict[str, Any], list],
         accept: str = "application/json",
         content_type: str = "application/json",
+        decode: bool = False,
     ) -> Iterator[Dict[str, Any]]:
         """
         Invoke a Bedrock model with streaming response.
         
         Args:
             model_id: The model ID
-            body: The request body as bytes
+            body: The request body as bytes, or a dict/list to serialize as JSON
             accept: The accept header (default: "application/json")
             content_type: The content type header (default: "application/json")
+            decode: Yield each chunk's JSON payload parsed into a dict instead
+                of the raw event; non-chunk events are yielded unchanged
+                (default: False)
             
         Yields:
-            Chunks from the streaming response
+            Events (or decoded chunk payloads) from the streaming response
             
         Raises:
             BedrockClientError: If the invocation fails
         """
         try:
+            body = _encode_body(body)
             response = self.runtime_client.invoke_model_with_response_stream(
                 modelId=model_id,
                 body=body,
@@ -293,61 +747,226 @@ class BedrockClientManager:
                 contentType=content_type,
             )
             
-            # Yield events from the stream
-            for event in response.get("body", []):
-                yield event
-                
+            # Yield events from the stream. Close it even if the consumer stops
+            # iterating early so the connection is not left in CLOSE_WAIT.
+            stream = response.get("body", [])
+            try:
+                for event in stream:
+                    if decode and "chunk" in event:
+                        yield _decode_json(event["chunk"]["bytes"])
+                    else:
+                        yield event
+            finally:
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
         except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            error_message = e.response.get("Error", {}).get("Message", str(e))
+            _raise_client_error(e, model_id, self.region_name, "InvokeModelWithResponseStream")
+        except BedrockClientError:
+            raise
+        except (BotoCoreError, Exception) as e:
+            raise BedrockClientError(
+                f"Unexpected error invoking streaming model {model_id}: {e}"
+            ) from e
+    
+    @property
+    def async_session(self):
+        """Get or create the aioboto3 session used by the async API."""
+        if self._async_session is None:
+            with self._client_lock:
+                if self._async_session is None:
+                    _ensure_aioboto3()
+                    self._async_session = _create_async_session(self.profile_name)
+        return self._async_session
+    
+    async def _get_async_runtime_client(self):
+        """
+        Get or create the async bedrock-runtime client for the running event loop.
+        
+        The client is entered once and kept open until aclose(), so concurrent
+        streams share its connection pool and keep-alive connections. Clients
+        are per event loop, since their connections belong to the loop that
+        opened them: a client left over from another loop is closed on that
+        loop if it is still running and replaced (see _release_async_client).
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            future = self._release_async_client()
+            if future is not None:
+                await asyncio.wrap_future(future)
+            self._async_loop = loop
+            self._async_lock = asyncio.Lock()
+        
+        if self._async_runtime_client is None:
+            async with self._async_lock:
+                if self._async_runtime_client is None:
+                    session = self.async_session
+                    # Same credential check as the sync clients; it may call STS
+                    await asyncio.to_thread(self._ensure_validated_locked)
+                    stack = contextlib.AsyncExitStack()
+                    self._async_runtime_client = await stack.enter_async_context(
+                        session.client("bedrock-runtime", config=self.config)
+                    )
+                    self._async_exit_stack = stack
+                    logger.info("Created async bedrock-runtime client in region: %s", self.region_name)
+        return self._async_runtime_client
+    
+    def _ensure_validated_locked(self) -> None:
+        """Run _ensure_validated() under the lock the sync clients use for it."""
+        with self._client_lock:
+            self._ensure_validated()
+    
+    def _release_async_client(self) -> Optional[Future]:
+        """
+        Detach the async client and close it on the event loop that opened it.
+        
+        Returns a Future for the close when that loop is still running. If it
+        has stopped the client cannot be closed any more; a warning is logged
+        and its connections are released when it is garbage collected.
+        """
+        stack, loop = self._async_exit_stack, self._async_loop
+        self._async_runtime_client = None
+        self._async_exit_stack = None
+        if stack is None:
+            return None
+        if loop is not None and loop.is_running():
+            return asyncio.run_coroutine_threadsafe(stack.aclose(), loop)
+        logger.warning(
+            "Dropping an async bedrock-runtime client whose event loop has stopped; "
+            "call aclose() before the loop ends to close its connections"
+        )
+        return None
+    
+    async def aclose(self) -> None:
+        """Close the async bedrock-runtime client, if one was opened."""
+        if self._async_loop is asyncio.get_running_loop():
+            stack = self._async_exit_stack
+            self._async_runtime_client = None
+            self._async_exit_stack = None
+            if stack is not None:
+                await stack.aclose()
+            return
+        future = self._release_async_client()
+        if future is not None:
+            await asyncio.wrap_future(future)
+    
+    async def __aenter__(self) -> "BedrockClientManager":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    async def ainvoke_model_with_response_stream(
+        self,
+        model_id: str,
+        body: Union[bytes, Dict[str, Any], list],
+        accept: str = "application/json",
+        content_type: str = "application/json",
+        decode: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Invoke a Bedrock model with streaming response without blocking the event loop.
+        
+        Async counterpart of invoke_model_with_response_stream(), backed by
+        aioboto3 (pip install aioboto3) and the same client Config. Calls on
+        the same event loop share one async client; close it with
+        ``await manager.aclose()`` or by using the manager as an ``async with``
+        context manager before the loop ends.
+        
+        Args:
+            model_id: The model ID
+            body: The request body as bytes, or a dict/list to serialize as JSON
+            accept: The accept header (default: "application/json")
+            content_type: The content type header (default: "application/json")
+            decode: Yield each chunk's JSON payload parsed into a dict instead
+                of the raw event (default: False)
             
-            if error_code == "AccessDeniedException":
-                raise BedrockClientError(
-                    f"Access denied to model {model_id}. "
-                    f"Ensure your IAM role/user has bedrock:InvokeModelWithResponseStream permission.\n"
-                    f"Error: {error_message}"
-                ) from e
-            else:
-                raise BedrockClientError(
-                    f"Failed to invoke streaming model {model_id}: [{error_code}] {error_message}"
-                ) from e
+        Yields:
+            Events (or decoded chunk payloads) from the streaming response
+            
+        Raises:
+            BedrockClientError: If aioboto3 is not installed or the invocation fails
+        """
+        try:
+            body = _encode_body(body)
+            client = await self._get_async_runtime_client()
+            response = await client.invoke_model_with_response_stream(
+                modelId=model_id,
+                body=body,
+                accept=accept,
+                contentType=content_type,
+            )
+            
+            # Close the stream even on early exit so its connection goes back
+            # to the shared client's pool
+            stream = response["body"]
+            try:
+                async for event in stream:
+                    if decode and "chunk" in event:
+                        yield _decode_json(event["chunk"]["bytes"])
+                    else:
+                        yield event
+            finally:
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+        except ClientError as e:
+            _raise_client_error(e, model_id, self.region_name, "InvokeModelWithResponseStream")
+        except BedrockClientError:
+            raise
         except (BotoCoreError, Exception) as e:
             raise BedrockClientError(
                 f"Unexpected error invoking streaming model {model_id}: {e}"
             ) from e
 
 
-# Global client manager instance (lazy initialized)
-_bedrock_manager: Optional[BedrockClientManager] = None
+# Cached client managers, keyed by (region_name, profile_name, max_retries)
+_managers: Dict[tuple, BedrockClientManager] = {}
+_managers_lock = threading.Lock()
 
 
 def get_bedrock_client(
     region_name: Optional[str] = None,
     profile_name: Optional[str] = None,
-    max_retries: int = 5,
+    max_retries: Optional[int] = None,
+    config: Optional[BiomniConfig] = None,
 ) -> BedrockClientManager:
     """
-    Get or create a global Bedrock client manager instance.
+    Get or create a cached Bedrock client manager instance.
     
     This function provides a convenient way to get a configured Bedrock client
-    without managing instances manually.
+    without managing instances manually. Repeated calls with the same settings
+    return the same manager; different settings get their own cached manager.
     
     Args:
-        region_name: AWS region (defaults to AWS_REGION env var or us-east-1)
-        profile_name: AWS profile name (defaults to AWS_PROFILE env var)
-        max_retries: Maximum number of retry attempts (default: 5)
+        region_name: AWS region (defaults to config.aws_region, then us-east-1)
+        profile_name: AWS profile name (defaults to config.aws_profile)
+        max_retries: Maximum number of retry attempts (defaults to
+            config.bedrock_max_retries)
+        config: Configuration providing the AWS settings (defaults to
+            biomni.config.default_config)
         
     Returns:
         BedrockClientManager instance
     """
-    global _bedrock_manager
-    
-    # Create new manager if not exists or if parameters differ
-    if _bedrock_manager is None:
-        _bedrock_manager = BedrockClientManager(
-            region_name=region_name,
-            profile_name=profile_name,
-            max_retries=max_retries,
-        )
+    if config is None:
+        config = default_config
+    
+    region_name = region_name or config.aws_region
+    profile_name = profile_name or config.aws_profile
+    if max_retries is None:
+        max_retries = config.bedrock_max_retries
+    key = (region_name, profile_name, max_retries)
+    
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = BedrockClientManager.from_config(
+                config,
+                region_name=region_name,
+                profile_name=profile_name,
+                max_retries=max_retries,
+            )
+            _managers[key] = manager
     
-    return _bedrock_manager
+    return manager
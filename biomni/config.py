@@ -6,11 +6,36 @@ Maintains full backward compatibility with existing code.
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Optional
 
 
-@dataclass
+def _env_bool(value: str) -> bool:
+    return value.lower() == "true"
+
+
+# (field, environment variables in priority order, cast) for BiomniConfig.
+# Old and new names are both listed for backwards compatibility.
+_ENV_OVERRIDES = (
+    ("path", ("BIOMNI_PATH", "BIOMNI_DATA_PATH"), str),
+    ("timeout_seconds", ("BIOMNI_TIMEOUT_SECONDS",), int),
+    ("llm", ("BIOMNI_LLM", "BIOMNI_LLM_MODEL"), str),
+    ("use_tool_retriever", ("BIOMNI_USE_TOOL_RETRIEVER",), _env_bool),
+    ("commercial_mode", ("BIOMNI_COMMERCIAL_MODE",), _env_bool),
+    ("temperature", ("BIOMNI_TEMPERATURE",), float),
+    ("base_url", ("BIOMNI_CUSTOM_BASE_URL",), str),
+    ("api_key", ("BIOMNI_CUSTOM_API_KEY",), str),
+    ("source", ("BIOMNI_SOURCE",), str),
+    # Protocols.io access token (prefer specific env vars)
+    ("protocols_io_access_token", ("PROTOCOLS_IO_ACCESS_TOKEN", "BIOMNI_PROTOCOLS_IO_ACCESS_TOKEN"), str),
+    # AWS Bedrock configuration
+    ("aws_region", ("AWS_REGION",), str),
+    ("aws_profile", ("AWS_PROFILE",), str),
+    ("bedrock_max_retries", ("BIOMNI_BEDROCK_MAX_RETRIES",), int),
+)
+
+
+@dataclass(slots=True)
 class BiomniConfig:
     """Central configuration for Biomni agent.
 
@@ -50,7 +75,7 @@ class BiomniConfig:
     # LLM source (auto-detected if None)
     source: Optional[str] = None
 
-    # Third-party integrations
+    # Third-party integrations (secret, so left out of to_dict())
     protocols_io_access_token: Optional[str] = None
 
     # AWS Bedrock configuration
@@ -60,58 +85,28 @@ class BiomniConfig:
 
     def __post_init__(self):
         """Load any environment variable overrides if they exist."""
-        # Check for environment variable overrides (optional)
-        # Support both old and new names for backwards compatibility
-        if os.getenv("BIOMNI_PATH") or os.getenv("BIOMNI_DATA_PATH"):
-            self.path = os.getenv("BIOMNI_PATH") or os.getenv("BIOMNI_DATA_PATH")
-        if os.getenv("BIOMNI_TIMEOUT_SECONDS"):
-            self.timeout_seconds = int(os.getenv("BIOMNI_TIMEOUT_SECONDS"))
-        if os.getenv("BIOMNI_LLM") or os.getenv("BIOMNI_LLM_MODEL"):
-            self.llm = os.getenv("BIOMNI_LLM") or os.getenv("BIOMNI_LLM_MODEL")
-        if os.getenv("BIOMNI_USE_TOOL_RETRIEVER"):
-            self.use_tool_retriever = os.getenv("BIOMNI_USE_TOOL_RETRIEVER").lower() == "true"
-        if os.getenv("BIOMNI_COMMERCIAL_MODE"):
-            self.commercial_mode = os.getenv("BIOMNI_COMMERCIAL_MODE").lower() == "true"
-        if os.getenv("BIOMNI_TEMPERATURE"):
-            self.temperature = float(os.getenv("BIOMNI_TEMPERATURE"))
-        if os.getenv("BIOMNI_CUSTOM_BASE_URL"):
-            self.base_url = os.getenv("BIOMNI_CUSTOM_BASE_URL")
-        if os.getenv("BIOMNI_CUSTOM_API_KEY"):
-            self.api_key = os.getenv("BIOMNI_CUSTOM_API_KEY")
-        if os.getenv("BIOMNI_SOURCE"):
-            self.source = os.getenv("BIOMNI_SOURCE")
-
-        # Protocols.io access token (prefer specific env vars)
-        env_token = os.getenv("PROTOCOLS_IO_ACCESS_TOKEN") or os.getenv("BIOMNI_PROTOCOLS_IO_ACCESS_TOKEN")
-        if env_token:
-            self.protocols_io_access_token = env_token
-
-        # AWS Bedrock configuration
-        if os.getenv("AWS_REGION"):
-            self.aws_region = os.getenv("AWS_REGION")
-        if os.getenv("AWS_DEFAULT_REGION") and not self.aws_region:
-            self.aws_region = os.getenv("AWS_DEFAULT_REGION")
-        if os.getenv("AWS_PROFILE"):
-            self.aws_profile = os.getenv("AWS_PROFILE")
-        if os.getenv("BIOMNI_BEDROCK_MAX_RETRIES"):
-            self.bedrock_max_retries = int(os.getenv("BIOMNI_BEDROCK_MAX_RETRIES"))
+        # Check for environment variable overrides (optional); the first
+        # non-empty variable listed for a field wins
+        environ = os.environ
+        for attr, names, cast in _ENV_OVERRIDES:
+            for name in names:
+                value = environ.get(name)
+                if value:
+                    setattr(self, attr, cast(value))
+                    break
+
+        # AWS_DEFAULT_REGION only fills in a region that is not otherwise set
+        if not self.aws_region:
+            self.aws_region = environ.get("AWS_DEFAULT_REGION") or self.aws_region
 
     def to_dict(self) -> dict:
         """Convert config to dictionary for easy access."""
-        return {
-            "path": self.path,
-            "timeout_seconds": self.timeout_seconds,
-            "llm": self.llm,
-            "temperature": self.temperature,
-            "use_tool_retriever": self.use_tool_retriever,
-            "commercial_mode": self.commercial_mode,
-            "base_url": self.base_url,
-            "api_key": self.api_key,
-            "source": self.source,
-            "aws_region": self.aws_region,
-            "aws_profile": self.aws_profile,
-            "bedrock_max_retries": self.bedrock_max_retries,
-        }
+        return {name: getattr(self, name) for name in _TO_DICT_FIELDS}
+
+
+# Fields left out of to_dict(), whose output is printed by the agent
+_TO_DICT_EXCLUDE = frozenset({"protocols_io_access_token"})
+_TO_DICT_FIELDS = tuple(f.name for f in fields(BiomniConfig) if f.name not in _TO_DICT_EXCLUDE)
 
 
 # Global default config instance (optional, for convenience)
@@ -5,9 +5,11 @@ These tests use botocore.stub.Stubber to mock boto3 clients without making
 actual AWS API calls.
 """
 
+import asyncio
 import json
 import os
-from unittest.mock import Mock, patch
+import sys
+from unittest.mock import AsyncMock, MagicMock, Mock, PropertyMock, patch
 
 import pytest
 
@@ -15,14 +17,57 @@ import pytest
 pytest.importorskip("boto3")
 pytest.importorskip("botocore")
 
-from botocore.stub import Stubber
-
+from biomni import bedrock_client
 from biomni.bedrock_client import (
     BedrockAuthenticationError,
     BedrockClientError,
     BedrockClientManager,
     get_bedrock_client,
 )
+from botocore.stub import Stubber
+
+
+@pytest.fixture
+def clear_session_cache():
+    """Drop shared boto3 sessions so a patched boto3.Session takes effect."""
+    bedrock_client._get_session.cache_clear()
+    yield
+    bedrock_client._get_session.cache_clear()
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _disable_metadata_credentials():
+    """Keep the credential chain away from IMDS and container endpoints.
+
+    On runners without those endpoints each probe waits for a timeout. The
+    container variables are removed rather than emptied because botocore
+    still queries the endpoint when they are set to "". Integration runs keep
+    the real environment so instance and task roles still resolve.
+    """
+    if os.getenv("RUN_BEDROCK_INTEGRATION") == "1":
+        yield
+        return
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AWS_EC2_METADATA_DISABLED", "true")
+        mp.delenv("AWS_CONTAINER_CREDENTIALS_RELATIVE_URI", raising=False)
+        mp.delenv("AWS_CONTAINER_CREDENTIALS_FULL_URI", raising=False)
+        yield
+
+
+@pytest.fixture(scope="module")
+def manager():
+    """Share one manager so botocore loads the service model once per module."""
+    return BedrockClientManager()
+
+
+@pytest.fixture
+def stub(manager):
+    """Activate a fresh Stubber on the shared runtime client for one test."""
+    client_stub = Stubber(manager.runtime_client)
+    client_stub.activate()
+    yield client_stub
+    client_stub.deactivate()
+    client_stub.assert_no_pending_responses()
 
 
 class TestBedrockClientManager:
@@ -62,20 +107,194 @@ class TestBedrockClientManager:
         manager = BedrockClientManager(profile_name="my-profile")
         assert manager.profile_name == "my-profile"
 
+    def test_config_enables_tcp_keepalive(self):
+        """Test that the shared client Config enables TCP keep-alive."""
+        manager = BedrockClientManager()
+        assert manager.config.tcp_keepalive is True
+
+    def test_runtime_client_socket_options(self):
+        """Test that runtime client sockets use TCP_NODELAY and SO_KEEPALIVE."""
+        import socket
+
+        manager = BedrockClientManager()
+        socket_options = manager.runtime_client._endpoint.http_session._socket_options
+
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in socket_options
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+    def test_config_retry_and_timeout_defaults(self):
+        """Test the default connect timeout and retry settings."""
+        with patch.dict(os.environ):
+            for name in ("AWS_DEFAULTS_MODE", "AWS_MAX_ATTEMPTS", "AWS_RETRY_MODE"):
+                os.environ.pop(name, None)
+            manager = BedrockClientManager()
+
+        assert manager.config.defaults_mode == "standard"
+        assert manager.config.connect_timeout is None
+        assert manager.config.read_timeout == 300
+        assert manager.config.retries == {"max_attempts": 5, "mode": "standard"}
+        # The "standard" defaults mode supplies the connect timeout
+        assert manager.runtime_client.meta.config.connect_timeout == 3.1
+
+    def test_config_retries_from_aws_env(self):
+        """Test that AWS_MAX_ATTEMPTS/AWS_RETRY_MODE apply unless arguments are passed."""
+        env = {"AWS_MAX_ATTEMPTS": "2", "AWS_RETRY_MODE": "adaptive"}
+        with patch.dict(os.environ, env):
+            from_env = BedrockClientManager()
+            explicit = BedrockClientManager(max_retries=7, retry_mode="standard")
+
+            assert from_env.config.retries == {}
+            assert from_env.max_retries is None
+            retry_config = from_env.runtime_client.meta.config.retries
+            assert retry_config["total_max_attempts"] == 2
+            assert retry_config["mode"] == "adaptive"
+            assert explicit.config.retries == {"max_attempts": 7, "mode": "standard"}
+
+    def test_config_defaults_mode_from_env(self):
+        """Test that AWS_DEFAULTS_MODE selects the botocore defaults mode."""
+        with patch.dict(os.environ, {"AWS_DEFAULTS_MODE": "in-region"}):
+            manager = BedrockClientManager()
+
+        assert manager.config.defaults_mode == "in-region"
+
+    def test_config_explicit_connect_timeout(self):
+        """Test that an explicit connect timeout overrides the defaults mode."""
+        manager = BedrockClientManager(connect_timeout=7)
+        assert manager.config.connect_timeout == 7
+        assert manager.runtime_client.meta.config.connect_timeout == 7
+
+    def test_config_fail_fast(self):
+        """Test that fail_fast shortens the connect timeout and retry budget."""
+        manager = BedrockClientManager(max_retries=10, fail_fast=True)
+        assert manager.config.connect_timeout == 3
+        assert manager.config.retries["max_attempts"] == 2
+
+    def test_config_adaptive_retry_mode(self):
+        """Test that adaptive retries can be opted into explicitly."""
+        manager = BedrockClientManager(retry_mode="adaptive")
+        assert manager.config.retries["mode"] == "adaptive"
+
+    def test_session_uses_cli_credential_cache(self):
+        """Test that assume-role credentials are cached in the AWS CLI cache."""
+        from botocore.credentials import JSONFileCache
+
+        manager = BedrockClientManager()
+        resolver = manager.session._session.get_component("credential_provider")
+        assert isinstance(resolver.get_provider("assume-role").cache, JSONFileCache)
+
+    def test_session_shared_across_managers(self):
+        """Test that managers with the same profile share one boto3 session."""
+        east = BedrockClientManager(region_name="us-east-1")
+        west = BedrockClientManager(region_name="us-west-2")
+        other = BedrockClientManager(profile_name="my-profile")
+
+        assert east.session is west.session
+        assert other.session is not east.session
+
+    @pytest.mark.usefixtures("clear_session_cache")
     def test_credentials_validation_no_credentials(self):
-        """Test that initialization fails when no credentials are available."""
+        """Test that first client access fails when no credentials are available."""
         # Mock session with no credentials
-        with patch("biomni.bedrock_client.boto3.Session") as mock_session_class:
+        with patch("boto3.Session") as mock_session_class:
             mock_session = Mock()
             mock_session.get_credentials.return_value = None
             mock_session_class.return_value = mock_session
 
+            manager = BedrockClientManager()
+
             with pytest.raises(BedrockAuthenticationError) as exc_info:
-                BedrockClientManager()
+                _ = manager.runtime_client
 
             assert "No AWS credentials found" in str(exc_info.value)
             assert "IAM role" in str(exc_info.value)
 
+    @pytest.mark.usefixtures("clear_session_cache")
+    def test_credentials_not_validated_on_init(self):
+        """Test that credentials are not resolved until a client is requested."""
+        with patch("boto3.Session") as mock_session_class:
+            mock_session = Mock()
+            mock_session_class.return_value = mock_session
+
+            BedrockClientManager()
+
+            mock_session.get_credentials.assert_not_called()
+            mock_session.client.assert_not_called()
+
+    @pytest.mark.usefixtures("clear_session_cache")
+    def test_sts_validation_is_opt_in(self):
+        """Test that STS GetCallerIdentity is only called with validate=True."""
+        with patch("boto3.Session") as mock_session_class:
+            mock_session = Mock()
+            mock_session_class.return_value = mock_session
+
+            manager = BedrockClientManager()
+            _ = manager.runtime_client
+            assert all(c.args[0] != "sts" for c in mock_session.client.call_args_list)
+
+            manager = BedrockClientManager(validate=True)
+            _ = manager.runtime_client
+            mock_session.client.assert_any_call("sts", config=manager.config)
+
+    @pytest.mark.usefixtures("clear_session_cache")
+    def test_validation_prefetched_in_background(self):
+        """Test that validate=True starts validation at init and surfaces its error."""
+        with patch("boto3.Session") as mock_session_class:
+            mock_session = Mock()
+            mock_session.get_credentials.return_value = None
+            mock_session_class.return_value = mock_session
+
+            manager = BedrockClientManager(validate=True)
+            assert manager._validate_future is not None
+
+            with pytest.raises(BedrockAuthenticationError):
+                _ = manager.runtime_client
+
+            mock_session.get_credentials.assert_called_once()
+
+    @pytest.mark.usefixtures("clear_session_cache")
+    def test_validation_retried_after_background_failure(self):
+        """Test that a failed background check does not stick once credentials appear."""
+        with patch("boto3.Session") as mock_session_class:
+            mock_session = Mock()
+            mock_session.get_credentials.return_value = None
+            mock_session_class.return_value = mock_session
+
+            manager = BedrockClientManager(validate=True)
+            with pytest.raises(BedrockAuthenticationError):
+                _ = manager.runtime_client
+
+            # Credentials become available, e.g. after an SSO login
+            mock_session.get_credentials.return_value = Mock()
+            _ = manager.runtime_client
+
+            assert manager._validate_future is None
+            assert mock_session.get_credentials.call_count == 2
+
+    @pytest.mark.usefixtures("clear_session_cache")
+    @pytest.mark.parametrize(
+        "env",
+        [
+            {"AWS_LAMBDA_FUNCTION_NAME": "biomni-fn"},
+            {"AWS_CONTAINER_CREDENTIALS_FULL_URI": "http://169.254.170.23/v1/credentials"},
+            {
+                "AWS_WEB_IDENTITY_TOKEN_FILE": "/var/run/secrets/eks.amazonaws.com/serviceaccount/token",
+                "AWS_ROLE_ARN": "arn:aws:iam::123456789012:role/biomni",
+            },
+        ],
+        ids=["lambda", "eks-pod-identity", "eks-irsa"],
+    )
+    def test_sts_validation_skipped_under_aws_runtime(self, env):
+        """Test that STS is skipped when the AWS runtime provides role credentials."""
+        with patch("boto3.Session") as mock_session_class, patch.dict(os.environ, env):
+            mock_session = Mock()
+            mock_session_class.return_value = mock_session
+
+            manager = BedrockClientManager(validate=True)
+            _ = manager.runtime_client
+
+            mock_session.get_credentials.assert_called_once()
+            assert all(c.args[0] != "sts" for c in mock_session.client.call_args_list)
+
     def test_runtime_client_property(self):
         """Test that runtime_client property creates client lazily."""
         manager = BedrockClientManager()
@@ -100,13 +319,89 @@ class TestBedrockClientManager:
             _ = manager.bedrock_client
             mock_client.assert_called_once_with("bedrock", config=manager.config)
 
-    def test_invoke_model_success(self):
-        """Test successful model invocation."""
+    def test_warm_opens_runtime_connection_in_background(self):
+        """Test that warm=True issues a lightweight bedrock-runtime call."""
+        with patch.object(BedrockClientManager, "runtime_client", new_callable=PropertyMock) as mock_runtime:
+            manager = BedrockClientManager(warm=True)
+            manager._warm_future.result(timeout=5)
+
+            mock_runtime.return_value.list_async_invokes.assert_called_once_with(maxResults=1)
+
+    def test_warm_disabled_by_default(self):
+        """Test that no warm-up thread is started by default."""
         manager = BedrockClientManager()
+        assert manager._warm_future is None
+
+    @pytest.mark.usefixtures("clear_session_cache")
+    def test_runtime_client_cache_opt_in(self):
+        """Test that BIOMNI_CACHE_BOTO_CLIENTS=1 shares clients between managers."""
+        with patch.dict(os.environ, {"BIOMNI_CACHE_BOTO_CLIENTS": "1"}):
+            first = BedrockClientManager(region_name="us-west-2")
+            second = BedrockClientManager(region_name="us-west-2")
+            other = BedrockClientManager(region_name="eu-west-1")
+
+            assert first.runtime_client is second.runtime_client
+            assert other.runtime_client is not first.runtime_client
+
+        # Without the opt-in every manager builds its own client
+        assert (
+            BedrockClientManager(region_name="us-west-2").runtime_client
+            is not BedrockClientManager(region_name="us-west-2").runtime_client
+        )
+
+    def test_session_access_is_serialized(self):
+        """Test that client creation and credential lookup hold the session lock."""
+        manager = BedrockClientManager(validate=False)
+        lock = bedrock_client._session_state(manager.session).lock
+        held = []
 
-        # Create stubber for runtime client
-        client_stub = Stubber(manager.runtime_client)
+        def record(*args, **kwargs):
+            held.append(lock.locked())
+            return Mock()
+
+        with patch.object(manager.session, "client", side_effect=record), patch.object(
+            manager.session, "get_credentials", side_effect=record
+        ):
+            _ = manager.runtime_client
+            _ = manager.bedrock_client
 
+        assert held == [True, True, True]
+
+    @pytest.mark.usefixtures("clear_session_cache")
+    def test_runtime_client_cache_is_bounded(self):
+        """Test that the client cache evicts the least recently used client."""
+        with patch.dict(os.environ, {"BIOMNI_CACHE_BOTO_CLIENTS": "1"}), patch.object(
+            bedrock_client, "_MAX_CACHED_CLIENTS", 2
+        ):
+            first = BedrockClientManager(region_name="us-west-2").runtime_client
+            _ = BedrockClientManager(region_name="eu-west-1").runtime_client
+            _ = BedrockClientManager(region_name="ap-southeast-1").runtime_client
+
+            manager = BedrockClientManager(region_name="us-west-2")
+            assert manager.runtime_client is not first
+            assert len(bedrock_client._session_state(manager.session).clients) == 2
+
+    def test_runtime_client_cache_released_with_session(self):
+        """Test that clearing the session cache also releases cached clients."""
+        import gc
+        import weakref
+
+        bedrock_client._get_session.cache_clear()
+        with patch.dict(os.environ, {"BIOMNI_CACHE_BOTO_CLIENTS": "1"}):
+            manager = BedrockClientManager(region_name="us-west-2")
+            client_ref = weakref.ref(manager.runtime_client)
+            session_ref = weakref.ref(manager.session)
+        assert session_ref() in bedrock_client._session_states
+
+        del manager
+        bedrock_client._get_session.cache_clear()
+        gc.collect()
+
+        assert session_ref() is None
+        assert client_ref() is None
+
+    def test_invoke_model_success(self, manager, stub):
+        """Test successful model invocation."""
         # Set up expected request and response
         model_id = "anthropic.claude-3-sonnet-20240229-v1:0"
         request_body = json.dumps(
@@ -135,28 +430,64 @@ class TestBedrockClientManager:
             "ResponseMetadata": {"HTTPStatusCode": 200},
         }
 
-        client_stub.add_response("invoke_model", response, expected_params)
+        stub.add_response("invoke_model", response, expected_params)
 
         # Invoke model
-        with client_stub:
-            result = manager.invoke_model(
-                model_id=model_id,
-                body=request_body.encode(),
-            )
+        result = manager.invoke_model(
+            model_id=model_id,
+            body=request_body.encode(),
+        )
 
-            assert result["contentType"] == "application/json"
-            assert result["ResponseMetadata"]["HTTPStatusCode"] == 200
+        assert result["contentType"] == "application/json"
+        assert result["ResponseMetadata"]["HTTPStatusCode"] == 200
 
-    def test_invoke_model_access_denied(self):
-        """Test model invocation with access denied error."""
+    def test_invoke_model_serializes_dict_body(self):
+        """Test that a dict body is serialized to JSON bytes before sending."""
         manager = BedrockClientManager()
-        client_stub = Stubber(manager.runtime_client)
+        manager._runtime_client = Mock()
+        payload = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": 1024,
+            "messages": [{"role": "user", "content": "Hello"}],
+        }
+
+        manager.invoke_model(model_id="anthropic.claude-3-sonnet-20240229-v1:0", body=payload)
+
+        sent_body = manager._runtime_client.invoke_model.call_args[1]["body"]
+        assert isinstance(sent_body, bytes)
+        assert json.loads(sent_body) == payload
+
+    def test_invoke_model_unserializable_body(self):
+        """Test that a body that is not JSON serializable raises BedrockClientError."""
+        manager = BedrockClientManager()
+        manager._runtime_client = Mock()
+
+        with pytest.raises(BedrockClientError, match="not JSON serializable"):
+            manager.invoke_model(model_id="test-model", body={"data": object()})
+        with pytest.raises(BedrockClientError, match="not JSON serializable"):
+            list(manager.invoke_model_with_response_stream(model_id="test-model", body={"data": {1, 2}}))
+
+        manager._runtime_client.invoke_model.assert_not_called()
+
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_encode_body_non_str_keys(self, use_orjson):
+        """Test that non-string dict keys serialize the same with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+
+        with patch.object(bedrock_client, "_orjson_available", use_orjson):
+            encoded = bedrock_client._encode_body({1: "a", "b": [2]})
+
+        assert json.loads(encoded) == {"1": "a", "b": [2]}
+
+    def test_invoke_model_access_denied(self, manager, stub):
+        """Test model invocation with access denied error."""
 
         model_id = "anthropic.claude-3-sonnet-20240229-v1:0"
         request_body = b'{"test": "data"}'
 
         # Simulate AccessDeniedException
-        client_stub.add_client_error(
+        stub.add_client_error(
             "invoke_model",
             service_error_code="AccessDeniedException",
             service_message="User is not authorized to perform: bedrock:InvokeModel",
@@ -168,23 +499,20 @@ class TestBedrockClientManager:
             },
         )
 
-        with client_stub:
-            with pytest.raises(BedrockClientError) as exc_info:
-                manager.invoke_model(model_id=model_id, body=request_body)
+        with pytest.raises(BedrockClientError) as exc_info:
+            manager.invoke_model(model_id=model_id, body=request_body)
 
-            assert "Access denied" in str(exc_info.value)
-            assert "bedrock:InvokeModel" in str(exc_info.value)
+        assert "Access denied" in str(exc_info.value)
+        assert "bedrock:InvokeModel" in str(exc_info.value)
 
-    def test_invoke_model_resource_not_found(self):
+    def test_invoke_model_resource_not_found(self, manager, stub):
         """Test model invocation with model not found error."""
-        manager = BedrockClientManager()
-        client_stub = Stubber(manager.runtime_client)
 
         model_id = "invalid.model-id"
         request_body = b'{"test": "data"}'
 
         # Simulate ResourceNotFoundException
-        client_stub.add_client_error(
+        stub.add_client_error(
             "invoke_model",
             service_error_code="ResourceNotFoundException",
             service_message="Model not found",
@@ -196,23 +524,18 @@ class TestBedrockClientManager:
             },
         )
 
-        with client_stub:
-            with pytest.raises(BedrockClientError) as exc_info:
-                manager.invoke_model(model_id=model_id, body=request_body)
-
-            assert "not found" in str(exc_info.value)
-            assert model_id in str(exc_info.value)
+        with pytest.raises(BedrockClientError) as exc_info:
+            manager.invoke_model(model_id=model_id, body=request_body)
 
-    def test_invoke_model_throttling(self):
-        """Test model invocation with throttling error."""
-        manager = BedrockClientManager()
-        client_stub = Stubber(manager.runtime_client)
+        assert "not found" in str(exc_info.value)
+        assert model_id in str(exc_info.value)
 
+    def test_invoke_model_throttling(self, manager, stub):
+        """Test model invocation with throttling error once retries are exhausted."""
         model_id = "anthropic.claude-3-sonnet-20240229-v1:0"
         request_body = b'{"test": "data"}'
 
-        # Simulate ThrottlingException
-        client_stub.add_client_error(
+        stub.add_client_error(
             "invoke_model",
             service_error_code="ThrottlingException",
             service_message="Rate exceeded",
@@ -224,35 +547,73 @@ class TestBedrockClientManager:
             },
         )
 
-        with client_stub:
+        with pytest.raises(BedrockClientError) as exc_info:
+            manager.invoke_model(model_id=model_id, body=request_body)
+
+        assert "throttled" in str(exc_info.value).lower()
+        assert "exponential backoff" not in str(exc_info.value)
+
+    @staticmethod
+    def _send_responses(manager, statuses):
+        """
+        Answer runtime HTTP requests with the given status codes, in order.
+
+        Unlike Stubber, a before-send handler runs below botocore's retry
+        handler, so every retried HTTP attempt is recorded.
+        """
+        from botocore.awsrequest import AWSResponse
+
+        sent = []
+
+        def before_send(request, **kwargs):
+            status = statuses[len(sent)]
+            sent.append(request)
+            if status == 429:
+                headers = {"x-amzn-ErrorType": "ThrottlingException"}
+                content = b'{"message": "Rate exceeded"}'
+            else:
+                headers = {"Content-Type": "application/json"}
+                content = b"{}"
+            raw = Mock(stream=lambda **kw: iter([content]))
+            return AWSResponse(request.url, status, headers, raw)
+
+        manager.runtime_client.meta.events.register("before-send.bedrock-runtime", before_send)
+        return sent
+
+    def test_invoke_model_throttling_http_attempts(self):
+        """Test that a throttled call is sent max_retries + 1 times in total."""
+        manager = BedrockClientManager(max_retries=3)
+        sent = self._send_responses(manager, [429] * 10)
+
+        with patch("botocore.endpoint.time.sleep") as mock_sleep:
             with pytest.raises(BedrockClientError) as exc_info:
-                manager.invoke_model(model_id=model_id, body=request_body)
+                manager.invoke_model(model_id="test-model", body=b"{}")
 
-            assert "throttled" in str(exc_info.value).lower()
+        assert "throttled" in str(exc_info.value).lower()
+        assert len(sent) == manager.max_retries + 1
+        assert mock_sleep.call_count == manager.max_retries
 
-    def test_invoke_model_with_response_stream_success(self):
-        """Test successful streaming model invocation."""
-        manager = BedrockClientManager()
-        client_stub = Stubber(manager.runtime_client)
+    def test_invoke_model_throttling_retry_succeeds(self):
+        """Test that a throttled request is retried with backoff and succeeds."""
+        manager = BedrockClientManager(max_retries=3)
+        sent = self._send_responses(manager, [429, 200])
 
-        model_id = "anthropic.claude-3-sonnet-20240229-v1:0"
-        request_body = b'{"test": "data"}'
+        with patch("botocore.endpoint.time.sleep") as mock_sleep:
+            result = manager.invoke_model(model_id="test-model", body=b"{}")
 
-        # Simulate streaming response
-        mock_event_stream = [
-            {"chunk": {"bytes": b'{"text": "Hello"}'}},
-            {"chunk": {"bytes": b'{"text": " World"}'}},
-        ]
+        assert result["ResponseMetadata"]["HTTPStatusCode"] == 200
+        assert len(sent) == 2
+        mock_sleep.assert_called_once()
 
-        response = {
-            "body": iter(mock_event_stream),
-            "contentType": "application/json",
-            "ResponseMetadata": {"HTTPStatusCode": 200},
-        }
+    def test_invoke_model_unmapped_client_error(self, manager, stub):
+        """Test that unmapped error codes keep the code and service message."""
+        model_id = "anthropic.claude-3-sonnet-20240229-v1:0"
+        request_body = b'{"test": "data"}'
 
-        client_stub.add_response(
-            "invoke_model_with_response_stream",
-            response,
+        stub.add_client_error(
+            "invoke_model",
+            service_error_code="ValidationException",
+            service_message="Malformed input request",
             expected_params={
                 "modelId": model_id,
                 "body": request_body,
@@ -261,26 +622,105 @@ class TestBedrockClientManager:
             },
         )
 
-        with client_stub:
-            events = list(
-                manager.invoke_model_with_response_stream(
-                    model_id=model_id,
-                    body=request_body,
-                )
+        with pytest.raises(BedrockClientError) as exc_info:
+            manager.invoke_model(model_id=model_id, body=request_body)
+
+        assert "[ValidationException]" in str(exc_info.value)
+        assert "Malformed input request" in str(exc_info.value)
+
+    def test_invoke_model_with_response_stream_success(self):
+        """Test successful streaming model invocation."""
+        manager = BedrockClientManager()
+
+        model_id = "anthropic.claude-3-sonnet-20240229-v1:0"
+        request_body = b'{"test": "data"}'
+
+        # Simulate streaming response (Stubber cannot stub an EventStream body)
+        mock_event_stream = MagicMock()
+        mock_event_stream.__iter__.return_value = iter(
+            [
+                {"chunk": {"bytes": b'{"text": "Hello"}'}},
+                {"chunk": {"bytes": b'{"text": " World"}'}},
+            ]
+        )
+        manager._runtime_client = Mock()
+        manager._runtime_client.invoke_model_with_response_stream.return_value = {
+            "body": mock_event_stream,
+            "contentType": "application/json",
+            "ResponseMetadata": {"HTTPStatusCode": 200},
+        }
+
+        events = list(
+            manager.invoke_model_with_response_stream(
+                model_id=model_id,
+                body=request_body,
             )
+        )
 
-            assert len(events) == 2
-            assert events[0]["chunk"]["bytes"] == b'{"text": "Hello"}'
+        assert len(events) == 2
+        assert events[0]["chunk"]["bytes"] == b'{"text": "Hello"}'
+        manager._runtime_client.invoke_model_with_response_stream.assert_called_once_with(
+            modelId=model_id,
+            body=request_body,
+            accept="application/json",
+            contentType="application/json",
+        )
+        mock_event_stream.close.assert_called_once()
 
-    def test_invoke_model_with_response_stream_access_denied(self):
-        """Test streaming invocation with access denied error."""
+    def test_invoke_model_with_response_stream_decode(self):
+        """Test that decode=True yields parsed chunk payloads."""
+        manager = BedrockClientManager()
+
+        mock_event_stream = MagicMock()
+        mock_event_stream.__iter__.return_value = iter(
+            [
+                {"chunk": {"bytes": b'{"text": "Hello"}'}},
+                {"metadata": {"usage": {}}},
+            ]
+        )
+        manager._runtime_client = Mock()
+        manager._runtime_client.invoke_model_with_response_stream.return_value = {"body": mock_event_stream}
+
+        events = list(manager.invoke_model_with_response_stream(model_id="test-model", body=b"{}", decode=True))
+
+        assert events == [{"text": "Hello"}, {"metadata": {"usage": {}}}]
+
+    def test_invoke_model_with_response_stream_closes_on_early_exit(self):
+        """Test that the event stream is closed when the consumer stops early."""
         manager = BedrockClientManager()
-        client_stub = Stubber(manager.runtime_client)
 
+        mock_event_stream = MagicMock()
+        mock_event_stream.__iter__.return_value = iter(
+            [
+                {"chunk": {"bytes": b'{"text": "Hello"}'}},
+                {"chunk": {"bytes": b'{"text": " World"}'}},
+            ]
+        )
+        manager._runtime_client = Mock()
+        manager._runtime_client.invoke_model_with_response_stream.return_value = {"body": mock_event_stream}
+
+        stream = manager.invoke_model_with_response_stream(model_id="test-model", body=b"{}")
+        next(stream)
+        stream.close()
+
+        mock_event_stream.close.assert_called_once()
+
+    def test_max_pool_connections_default(self):
+        """Test that the HTTP connection pool is larger than botocore's default of 10."""
+        manager = BedrockClientManager()
+        assert manager.config.max_pool_connections == 50
+
+    def test_max_pool_connections_configurable(self):
+        """Test that the HTTP connection pool size is passed to the Config."""
+        manager = BedrockClientManager(max_pool_connections=64)
+        assert manager.config.max_pool_connections == 64
+
+    def test_invoke_model_with_response_stream_access_denied(self, manager, stub):
+        """Test streaming invocation with access denied error."""
         model_id = "anthropic.claude-3-sonnet-20240229-v1:0"
         request_body = b'{"test": "data"}'
 
-        client_stub.add_client_error(
+        stub.add_client_error(
             "invoke_model_with_response_stream",
             service_error_code="AccessDeniedException",
             service_message="Not authorized for streaming",
@@ -292,17 +732,196 @@ class TestBedrockClientManager:
             },
         )
 
-        with client_stub:
-            with pytest.raises(BedrockClientError) as exc_info:
-                list(
-                    manager.invoke_model_with_response_stream(
-                        model_id=model_id,
-                        body=request_body,
+        with pytest.raises(BedrockClientError) as exc_info:
+            list(
+                manager.invoke_model_with_response_stream(
+                    model_id=model_id,
+                    body=request_body,
+                )
+            )
+
+        assert "Access denied" in str(exc_info.value)
+        assert "InvokeModelWithResponseStream" in str(exc_info.value)
+
+    @staticmethod
+    def _mock_async_session(manager, events=(), error=None):
+        """Attach a mock aioboto3 session whose runtime client streams events."""
+        stream = MagicMock()
+        stream.__aiter__.return_value = list(events)
+        client = MagicMock()
+        client.invoke_model_with_response_stream = AsyncMock(
+            return_value={"body": stream}, side_effect=error
+        )
+        session = Mock()
+        session.client.return_value.__aenter__ = AsyncMock(return_value=client)
+        session.client.return_value.__aexit__ = AsyncMock(return_value=False)
+        manager._async_session = session
+        return session, client
+
+    @staticmethod
+    async def _collect(agen):
+        return [event async for event in agen]
+
+    def test_ainvoke_model_with_response_stream_success(self):
+        """Test that the async stream yields every event from the aioboto3 client."""
+        manager = BedrockClientManager()
+        session, client = self._mock_async_session(
+            manager,
+            events=[
+                {"chunk": {"bytes": b'{"text": "Hello"}'}},
+                {"chunk": {"bytes": b'{"text": " World"}'}},
+            ],
+        )
+
+        events = asyncio.run(
+            self._collect(manager.ainvoke_model_with_response_stream(model_id="test-model", body={"a": 1}))
+        )
+
+        assert [e["chunk"]["bytes"] for e in events] == [b'{"text": "Hello"}', b'{"text": " World"}']
+        session.client.assert_called_once_with("bedrock-runtime", config=manager.config)
+        call_kwargs = client.invoke_model_with_response_stream.call_args[1]
+        assert call_kwargs["modelId"] == "test-model"
+        assert json.loads(call_kwargs["body"]) == {"a": 1}
+
+    def test_ainvoke_model_with_response_stream_access_denied(self):
+        """Test that async ClientErrors are translated like the sync path."""
+        from botocore.exceptions import ClientError
+
+        manager = BedrockClientManager()
+        error = ClientError(
+            {"Error": {"Code": "AccessDeniedException", "Message": "Not authorized"}},
+            "InvokeModelWithResponseStream",
+        )
+        self._mock_async_session(manager, error=error)
+
+        with pytest.raises(BedrockClientError) as exc_info:
+            asyncio.run(
+                self._collect(manager.ainvoke_model_with_response_stream(model_id="test-model", body=b"{}"))
+            )
+
+        assert "Access denied" in str(exc_info.value)
+        assert "InvokeModelWithResponseStream" in str(exc_info.value)
+
+    def test_async_session_requires_aioboto3(self):
+        """Test that a missing aioboto3 raises a BedrockClientError with install help."""
+        manager = BedrockClientManager()
+
+        with patch.object(bedrock_client, "aioboto3", None), patch.dict(sys.modules, {"aioboto3": None}):
+            with pytest.raises(BedrockClientError, match="pip install aioboto3"):
+                _ = manager.async_session
+
+    def test_ainvoke_reuses_async_client(self):
+        """Test that async streams share one client until aclose()."""
+        manager = BedrockClientManager()
+        session, client = self._mock_async_session(manager, events=[{"chunk": {"bytes": b"{}"}}])
+
+        async def run():
+            async with manager:
+                for _ in range(3):
+                    await self._collect(
+                        manager.ainvoke_model_with_response_stream(model_id="test-model", body=b"{}")
                     )
+
+        with patch.object(manager, "_ensure_validated") as mock_validate:
+            asyncio.run(run())
+
+        session.client.assert_called_once_with("bedrock-runtime", config=manager.config)
+        assert client.invoke_model_with_response_stream.await_count == 3
+        session.client.return_value.__aexit__.assert_awaited_once()
+        mock_validate.assert_called_once()
+        assert manager._async_runtime_client is None
+
+    def test_ainvoke_recreates_client_for_new_event_loop(self, caplog):
+        """Test that a client opened under a finished event loop is replaced with a warning."""
+        manager = BedrockClientManager()
+        session, _ = self._mock_async_session(manager)
+
+        with caplog.at_level("WARNING", logger="biomni.bedrock_client"):
+            for _ in range(2):
+                asyncio.run(
+                    self._collect(manager.ainvoke_model_with_response_stream(model_id="test-model", body=b"{}"))
                 )
 
-            assert "Access denied" in str(exc_info.value)
-            assert "InvokeModelWithResponseStream" in str(exc_info.value)
+        assert session.client.call_count == 2
+        assert "event loop has stopped" in caplog.text
+
+    def test_ainvoke_closes_client_on_running_loop(self):
+        """Test that a client from another, still running loop is closed on that loop."""
+        import threading
+
+        manager = BedrockClientManager()
+        session, _ = self._mock_async_session(manager)
+        stream = manager.ainvoke_model_with_response_stream
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(
+                self._collect(stream(model_id="test-model", body=b"{}")), other_loop
+            ).result(timeout=5)
+            asyncio.run(self._collect(stream(model_id="test-model", body=b"{}")))
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(timeout=5)
+            other_loop.close()
+
+        assert session.client.call_count == 2
+        session.client.return_value.__aexit__.assert_awaited_once()
+
+    def test_ainvoke_validates_under_client_lock(self):
+        """Test that async validation takes the lock the sync path validates under."""
+        manager = BedrockClientManager()
+        self._mock_async_session(manager)
+        held = []
+
+        with patch.object(manager, "_ensure_validated", side_effect=lambda: held.append(manager._client_lock.locked())):
+            asyncio.run(
+                self._collect(manager.ainvoke_model_with_response_stream(model_id="test-model", body=b"{}"))
+            )
+
+        assert held == [True]
+
+    def test_async_session_uses_cli_credential_cache(self):
+        """Test that the aioboto3 session shares the AWS CLI assume-role cache."""
+        pytest.importorskip("aioboto3")
+        from botocore.credentials import JSONFileCache
+
+        manager = BedrockClientManager(profile_name="my-profile")
+        botocore_session = manager.async_session._session
+        resolver = botocore_session.get_component("credential_provider")
+
+        assert botocore_session.profile == "my-profile"
+        assert isinstance(resolver.get_provider("assume-role").cache, JSONFileCache)
+
+
+class TestBedrockClientFromConfig:
+    """Test suite for building managers from BiomniConfig."""
+
+    def test_from_config_uses_aws_settings(self):
+        """Test that from_config takes region, profile and retries from the config."""
+        from biomni.config import BiomniConfig
+
+        with patch.dict(os.environ, {}, clear=True):
+            config = BiomniConfig(aws_region="eu-west-3", aws_profile="my-profile", bedrock_max_retries=2)
+
+        manager = BedrockClientManager.from_config(config)
+
+        assert manager.region_name == "eu-west-3"
+        assert manager.profile_name == "my-profile"
+        assert manager.max_retries == 2
+
+    def test_get_bedrock_client_with_config(self):
+        """Test that get_bedrock_client falls back to the given config."""
+        from biomni.config import BiomniConfig
+
+        with patch.dict(os.environ, {}, clear=True):
+            config = BiomniConfig(aws_region="ca-central-1", bedrock_max_retries=3)
+
+        client = get_bedrock_client(config=config)
+
+        assert client.region_name == "ca-central-1"
+        assert client.max_retries == 3
+        assert get_bedrock_client(config=config) is client
 
 
 class TestGetBedrockClient:
@@ -323,6 +942,13 @@ class TestGetBedrockClient:
         client = get_bedrock_client(profile_name="test-profile")
         assert client.profile_name == "test-profile"
 
+    def test_get_bedrock_client_caches_per_config(self):
+        """Test that managers are reused per (region, profile, retries) key."""
+        first = get_bedrock_client(region_name="us-west-2")
+        assert get_bedrock_client(region_name="us-west-2") is first
+        assert get_bedrock_client(region_name="eu-west-1") is not first
+        assert get_bedrock_client(region_name="us-west-2", max_retries=2) is not first
+
 
 class TestBedrockClientIntegration:
     """
@@ -368,7 +994,7 @@ class TestBedrockClientIntegration:
     def test_real_credentials_validation(self):
         """Test that credentials validation works with real AWS credentials."""
         # This should not raise if credentials are properly configured
-        manager = BedrockClientManager()
+        manager = BedrockClientManager(validate=True)
 
         # Verify we can access the runtime client
         assert manager.runtime_client is not None
@@ -0,0 +1,154 @@
+"""
+Unit tests for BiomniConfig.
+
+Environment variables are patched with patch.dict(os.environ, ..., clear=True)
+so overrides from the developer's shell do not leak into the tests.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from biomni.config import BiomniConfig
+
+
+class TestBiomniConfigToDict:
+    """Test suite for BiomniConfig.to_dict()."""
+
+    def test_to_dict_keys(self):
+        """Test that to_dict() returns the public settings in field order."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = BiomniConfig()
+
+        assert list(config.to_dict()) == [
+            "path",
+            "timeout_seconds",
+            "llm",
+            "temperature",
+            "use_tool_retriever",
+            "commercial_mode",
+            "base_url",
+            "api_key",
+            "source",
+            "aws_region",
+            "aws_profile",
+            "bedrock_max_retries",
+        ]
+
+    def test_to_dict_omits_protocols_io_token(self):
+        """Test that the protocols.io access token is never included."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = BiomniConfig(protocols_io_access_token="secret-token")
+
+        config_dict = config.to_dict()
+        assert "protocols_io_access_token" not in config_dict
+        assert "secret-token" not in config_dict.values()
+
+    def test_to_dict_reflects_changes(self):
+        """Test that to_dict() reads current values, not values at creation."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = BiomniConfig()
+        config.path = "./custom_data"
+
+        assert config.to_dict()["path"] == "./custom_data"
+
+    def test_slots_reject_unknown_attributes(self):
+        """Test that misspelled settings raise instead of being silently added."""
+        config = BiomniConfig()
+
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.llm_modle = "gpt-4"
+
+
+class TestBiomniConfigEnvOverrides:
+    """Test suite for environment variable overrides in BiomniConfig."""
+
+    def test_defaults_without_env(self):
+        """Test that defaults are kept when no override is set."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = BiomniConfig()
+
+        assert config.path == "./data"
+        assert config.timeout_seconds == 600
+        assert config.use_tool_retriever is True
+        assert config.aws_region is None
+        assert config.bedrock_max_retries == 5
+
+    def test_path_prefers_biomni_path(self):
+        """Test that BIOMNI_PATH wins over the legacy BIOMNI_DATA_PATH."""
+        env = {"BIOMNI_PATH": "/new", "BIOMNI_DATA_PATH": "/old"}
+        with patch.dict(os.environ, env, clear=True):
+            assert BiomniConfig().path == "/new"
+
+    def test_path_falls_back_to_biomni_data_path(self):
+        """Test that BIOMNI_DATA_PATH is used when BIOMNI_PATH is unset."""
+        with patch.dict(os.environ, {"BIOMNI_DATA_PATH": "/old"}, clear=True):
+            assert BiomniConfig().path == "/old"
+
+    def test_empty_values_are_ignored(self):
+        """Test that empty variables neither override nor block a fallback."""
+        env = {"BIOMNI_PATH": "", "BIOMNI_DATA_PATH": "/old", "BIOMNI_TIMEOUT_SECONDS": ""}
+        with patch.dict(os.environ, env, clear=True):
+            config = BiomniConfig(timeout_seconds=1200)
+
+        assert config.path == "/old"
+        assert config.timeout_seconds == 1200
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("true", True), ("True", True), ("false", False), ("1", False), ("yes", False)],
+    )
+    def test_bool_cast(self, value, expected):
+        """Test that only a case-insensitive "true" enables a flag."""
+        env = {"BIOMNI_USE_TOOL_RETRIEVER": value, "BIOMNI_COMMERCIAL_MODE": value}
+        with patch.dict(os.environ, env, clear=True):
+            config = BiomniConfig()
+
+        assert config.use_tool_retriever is expected
+        assert config.commercial_mode is expected
+
+    def test_numeric_casts(self):
+        """Test that numeric settings are parsed from their strings."""
+        env = {
+            "BIOMNI_TIMEOUT_SECONDS": "1200",
+            "BIOMNI_TEMPERATURE": "0.25",
+            "BIOMNI_BEDROCK_MAX_RETRIES": "3",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            config = BiomniConfig()
+
+        assert config.timeout_seconds == 1200
+        assert config.temperature == 0.25
+        assert config.bedrock_max_retries == 3
+
+    def test_env_overrides_constructor_arguments(self):
+        """Test that environment variables take precedence over arguments."""
+        with patch.dict(os.environ, {"BIOMNI_LLM": "gpt-4", "AWS_REGION": "us-west-2"}, clear=True):
+            config = BiomniConfig(llm="claude-sonnet-4-5", aws_region="eu-west-1")
+
+        assert config.llm == "gpt-4"
+        assert config.aws_region == "us-west-2"
+
+    def test_aws_default_region_fills_unset_region(self):
+        """Test that AWS_DEFAULT_REGION is used when no region is set."""
+        with patch.dict(os.environ, {"AWS_DEFAULT_REGION": "ap-southeast-1"}, clear=True):
+            assert BiomniConfig().aws_region == "ap-southeast-1"
+
+    def test_aws_default_region_does_not_override(self):
+        """Test that AWS_DEFAULT_REGION loses to AWS_REGION and to an explicit region."""
+        env = {"AWS_REGION": "us-west-2", "AWS_DEFAULT_REGION": "ap-southeast-1"}
+        with patch.dict(os.environ, env, clear=True):
+            assert BiomniConfig().aws_region == "us-west-2"
+
+        with patch.dict(os.environ, {"AWS_DEFAULT_REGION": "ap-southeast-1"}, clear=True):
+            assert BiomniConfig(aws_region="eu-west-1").aws_region == "eu-west-1"
+
+    def test_protocols_io_token_prefers_specific_variable(self):
+        """Test the protocols.io token lookup order."""
+        env = {"PROTOCOLS_IO_ACCESS_TOKEN": "specific", "BIOMNI_PROTOCOLS_IO_ACCESS_TOKEN": "prefixed"}
+        with patch.dict(os.environ, env, clear=True):
+            assert BiomniConfig().protocols_io_access_token == "specific"
+
+        with patch.dict(os.environ, {"BIOMNI_PROTOCOLS_IO_ACCESS_TOKEN": "prefixed"}, clear=True):
+            assert BiomniConfig().protocols_io_access_token == "prefixed"